@@ -19,19 +19,29 @@ python linkedin_scrape_and_apply.py \
   --cover-file "/home/adya/cover.txt"
 """
 
-import argparse, os, time, random, re, sys
+import argparse, asyncio, os, time, random, re, sys, shutil, tempfile
 from urllib.parse import quote_plus
-from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import util as mp_util
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+from sklearn.metrics.pairwise import linear_kernel
 import numpy as np
+import joblib
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+
+# optional: async Playwright backend for description fetching
+try:
+    from playwright.async_api import async_playwright
+except Exception:
+    async_playwright = None
 
 # ---------------- resume parsing ----------------
 # add imports near top
@@ -40,7 +50,7 @@ try:
 except Exception:
     docx2txt = None
 
-# prefer pdfplumber if available, otherwise use PyPDF2
+# prefer PyPDF2 (lighter, faster); pdfplumber is the fallback for PDFs it can't read well
 try:
     import pdfplumber
 except Exception:
@@ -51,27 +61,43 @@ try:
 except Exception:
     PdfReader = None
 
-def read_pdf_with_fallback(path):
-    path = os.path.expanduser(path)
-    if pdfplumber:
-        text = []
-        with pdfplumber.open(path) as pdf:
-            for p in pdf.pages:
-                text.append(p.extract_text() or "")
-        return "\n".join(text)
-    elif PdfReader:
-        text = []
-        with open(path, "rb") as f:
-            reader = PdfReader(f)
+def _pypdf2_text(path):
+    with open(path, "rb") as f:
+        reader = PdfReader(f)
+        def _pages():
             for p in reader.pages:
                 try:
-                    text.append(p.extract_text() or "")
+                    yield p.extract_text() or ""
                 except Exception:
                     # page-level extraction failed; continue
-                    text.append("")
-        return "\n".join(text)
-    else:
+                    yield ""
+        return "\n".join(_pages())
+
+def _pdfplumber_text(path):
+    with pdfplumber.open(path) as pdf:
+        def _pages():
+            for p in pdf.pages:
+                yield p.extract_text() or ""
+                # drop the parsed page tree before moving on
+                p.flush_cache()
+        return "\n".join(_pages())
+
+def read_pdf_with_fallback(path):
+    path = os.path.expanduser(path)
+    if not PdfReader and not pdfplumber:
         raise RuntimeError("No PDF parser installed. Install pdfplumber (`pip install pdfplumber`) or PyPDF2 (`pip install PyPDF2`).")
+    text = ""
+    if PdfReader:
+        try:
+            text = _pypdf2_text(path)
+        except Exception:
+            # malformed/encrypted for PyPDF2; pdfplumber may still read it
+            if not pdfplumber:
+                raise
+    # too little text usually means a layout PyPDF2 can't handle
+    if len(text.strip()) < 100 and pdfplumber:
+        text = _pdfplumber_text(path)
+    return text
 
 def read_docx_with_fallback(path):
     if docx2txt:
@@ -88,6 +114,11 @@ def read_resume(path):
     path = os.path.expanduser(path)
     if not os.path.exists(path):
         raise FileNotFoundError(path)
+    # keyed on mtime so an edited resume is parsed again
+    return _read_resume_cached(path, os.path.getmtime(path))
+
+@lru_cache(maxsize=4)
+def _read_resume_cached(path, mtime):
     lower = path.lower()
     if lower.endswith(".pdf"):
         return read_pdf_with_fallback(path)
@@ -98,8 +129,15 @@ def read_resume(path):
             return f.read()
 
 
+_WS_RE = re.compile(r'\s+')
+
 def normalize(s):
-    return re.sub(r'\s+', ' ', s.strip())
+    s = s.strip()
+    # every whitespace char other than ' ' is non-printable, so a string with no
+    # double space that is printable has nothing to collapse (usual for titles)
+    if "  " in s or not s.isprintable():
+        return _WS_RE.sub(' ', s)
+    return s
 
 # ---------------- build linkedin search url ----------------
 def build_search_url(keyword, location=None, start=0):
@@ -113,7 +151,80 @@ def build_search_url(keyword, location=None, start=0):
 
 # ---------------- selenium helpers ----------------
 
-def create_driver(profile_dir=None, profile_name="Default", headless=False):
+# job page heuristics; each chain is resolved in one browser roundtrip
+# (an XPath union, or FIRST_TEXT_FN where selector priority matters)
+TITLE_XPATH = "//h1"
+COMPANY_SELECTORS = (
+    "//a[contains(@href,'/company/') or contains(@class,'topcard__org-name')]",
+    "//span[contains(@class,'topcard__flavor')]",                # fallback: small span near title
+)
+DESC_SELECTORS = (
+    "//div[contains(@class,'description')]",                 # generic
+    "//div[contains(@class,'job-description')]",             # variant
+    "//div[contains(@class,'jobs-description')]",           # unified
+    "//div[contains(@class,'show-more-less-html__markup')]",# new linkedin container
+    "//section[contains(@class,'description')]",            # fallback
+)
+DESC_XPATH = " | ".join(DESC_SELECTORS)
+DESC_FALLBACK_XPATH = "//div[@id='job-details']"
+SEARCH_RESULTS_XPATH = "//div[contains(@class,'job-card-container')] | //a[contains(@href,'/jobs/view/')]"
+DIALOG_XPATH = "//div[contains(@role,'dialog')]"
+# Easy Apply step buttons (final and intermediate) in a single union
+NAV_XPATH = ("//button[.//span[contains(text(),'Next') or contains(text(),'Continue') or "
+             "contains(text(),'Submit') or contains(text(),'Apply') or contains(text(),'Done')]]")
+SUBMIT_WORDS = ("submit", "apply", "done")
+NEXT_WORDS = ("next", "continue")
+
+def wait_for(driver, timeout=8):
+    """Condition wait polling every 100ms, used instead of fixed sleeps before reading the page"""
+    return WebDriverWait(driver, timeout, poll_frequency=0.1)
+
+# innerText of every node matching arguments[0] (an XPath) in one script call,
+# instead of one WebDriver roundtrip per node for .text
+XPATH_TEXTS_JS = """
+const snap = document.evaluate(arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const out = [];
+for (let i = 0; i < snap.snapshotLength; i++) out.push(snap.snapshotItem(i).innerText);
+return out;
+"""
+
+# first non-empty innerText, trying the XPaths in order (a union would return
+# document order and let a fallback selector win); callable from Playwright's
+# page.evaluate and, wrapped, from Selenium's execute_script
+FIRST_TEXT_FN = """(sels) => {
+    for (const sel of sels) {
+        const snap = document.evaluate(sel, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        for (let i = 0; i < snap.snapshotLength; i++) {
+            const t = (snap.snapshotItem(i).innerText || "").trim();
+            if (t) return t;
+        }
+    }
+    return "";
+}"""
+FIRST_TEXT_JS = f"return ({FIRST_TEXT_FN})(arguments[0]);"
+
+# true once a node matching arguments[0] has more than 50 chars of text (the
+# filter_desc_texts threshold); empty shells/skeletons don't count as rendered
+DESC_READY_FN = """(sel) => {
+    const snap = document.evaluate(sel, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (let i = 0; i < snap.snapshotLength; i++) {
+        if ((snap.snapshotItem(i).innerText || "").trim().length > 50) return true;
+    }
+    return false;
+}"""
+DESC_READY_JS = f"return ({DESC_READY_FN})(arguments[0]);"
+
+def filter_desc_texts(raw_texts):
+    """Keep substantial description texts; the union also matches nested containers, so drop repeats"""
+    texts = []
+    for t in raw_texts:
+        t = (t or "").strip()
+        if len(t) > 50 and not any(t in kept for kept in texts):
+            texts.append(t)
+    return texts
+
+def create_driver(profile_dir=None, profile_name="Default", headless=False, lightweight=False):
+    """lightweight: profile_dir is a disposable copy; also skip stylesheets (read-only fetch workers; breaks clicking)"""
     chrome_opts = Options()
     if profile_dir:
         chrome_opts.add_argument(f"--user-data-dir={profile_dir}")
@@ -122,26 +233,66 @@ def create_driver(profile_dir=None, profile_name="Default", headless=False):
     if headless:
         chrome_opts.add_argument("--headless=new")
         chrome_opts.add_argument("--window-size=1920,1080")
+    # skip images for fewer bytes per page load. ChromeDriver writes `prefs` into the
+    # profile's Preferences file, so they are only set on throwaway user-data-dirs
+    # (none given, or a worker's copy_profile copy); the user's real profile only
+    # gets the per-session flag, and not in a visible browser where they review applications
+    if lightweight or not profile_dir:
+        content_prefs = {"profile.managed_default_content_settings.images": 2}
+        if lightweight:
+            content_prefs["profile.managed_default_content_settings.stylesheets"] = 2
+        chrome_opts.add_experimental_option("prefs", content_prefs)
+    if lightweight or headless:
+        chrome_opts.add_argument("--blink-settings=imagesEnabled=false")
 
-    # Use Service(...) and pass it via service=, not as a positional argument
-    service = Service(ChromeDriverManager().install())
+    # Use Service(...) and pass it via service=, not as a positional argument.
+    # No driver path: Selenium Manager (selenium>=4.11) resolves and caches chromedriver
+    service = Service()
     driver = webdriver.Chrome(service=service, options=chrome_opts)
+    # keep the HTTP cache on so LinkedIn's CSS/JS isn't refetched for every job page
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": False})
+    except Exception:
+        pass
     return driver
 
 
+# one script call returns every visible result card (url + left-rail title/company)
+CARDS_JS = """
+return Array.from(document.querySelectorAll('div.job-card-container')).map(c => ({
+    href: c.querySelector("a[href*='/jobs/view/']")?.href,
+    title: c.querySelector('.job-card-list__title')?.innerText,
+    company: c.querySelector('.job-card-container__company-name')?.innerText
+}));
+"""
+# fallback: every job anchor's href in one script call (no per-anchor get_attribute)
+ANCHORS_JS = "return Array.from(document.querySelectorAll(\"a[href*='/jobs/view/']\")).map(a => a.href);"
+
 def scroll_container_collect_links(driver, max_links=50, wait_seconds=1.0):
-    """Given a search results page loaded, scroll and collect job links (unique)"""
-    links = OrderedDict()
+    """Given a search results page loaded, scroll and collect unique job stubs
+    ({url, title, company, description=""}) from the result cards"""
+    links = {}  # url -> stub, insertion ordered
     last_height = driver.execute_script("return document.body.scrollHeight")
     tries = 0
     while len(links) < max_links and tries < 20:
-        # find anchor tags that point to jobs view
-        anchors = driver.find_elements(By.XPATH, "//a[contains(@href,'/jobs/view/')]")
-        for a in anchors:
-            href = a.get_attribute("href")
+        cards = driver.execute_script(CARDS_JS) or []
+        for c in cards:
+            href = c.get("href")
             if href and "/jobs/view/" in href:
                 # clean query params - keep unique id part
-                links[href.split("?")[0]] = True
+                u = href.split("?")[0]
+                if u not in links:
+                    links[u] = {"url": u, "title": normalize(c.get("title") or ""),
+                                "company": normalize(c.get("company") or ""), "description": ""}
+                if len(links) >= max_links:
+                    break
+        if not cards:
+            # card markup not found (layout change / logged out): plain job anchors
+            hrefs = driver.execute_script(ANCHORS_JS) or []
+            for u in dict.fromkeys(h.split("?")[0] for h in hrefs if h and "/jobs/view/" in h):
+                if u not in links:
+                    links[u] = {"url": u, "title": "", "company": "", "description": ""}
                 if len(links) >= max_links:
                     break
         # scroll down to load more results
@@ -153,62 +304,41 @@ def scroll_container_collect_links(driver, max_links=50, wait_seconds=1.0):
         else:
             last_height = new_height
             tries = 0
-    return list(links.keys())
+    return list(links.values())
 
 def fetch_job_description(driver, job_url, timeout=6):
     """Open job_url in the same tab and extract job title, company, description text (best effort)"""
     driver.get(job_url)
-    # small wait for rendering
+    # wait until a description container has rendered text (best effort; read whatever is there)
     try:
-        WebDriverWait(driver, timeout).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+        wait_for(driver, timeout).until(lambda d: d.execute_script(DESC_READY_JS, f"{DESC_XPATH} | {DESC_FALLBACK_XPATH}"))
     except Exception:
         pass
-    time.sleep(1 + random.random()*0.7)
     # heuristics for title/company/desc
     title = ""
     company = ""
     desc = ""
     # title
     try:
-        el = driver.find_element(By.XPATH, "//h1")
+        el = driver.find_element(By.XPATH, TITLE_XPATH)
         title = el.text.strip()
     except Exception:
         pass
-    # company
+    # company: /company/ link first, topcard flavor span only as fallback
     try:
-        el = driver.find_element(By.XPATH, "//a[contains(@href,'/company/') or contains(@class,'topcard__org-name')]")
-        company = el.text.strip()
+        company = driver.execute_script(FIRST_TEXT_JS, list(COMPANY_SELECTORS)) or ""
     except Exception:
-        # fallback: small span near title
-        try:
-            el = driver.find_element(By.XPATH, "//span[contains(@class,'topcard__flavor')]")
-            company = el.text.strip()
-        except Exception:
-            pass
-    # description: try common containers
-    desc_selectors = [
-        "//div[contains(@class,'description')]",                 # generic
-        "//div[contains(@class,'job-description')]",             # variant
-        "//div[contains(@class,'jobs-description')]",           # unified
-        "//div[contains(@class,'show-more-less-html__markup')]",# new linkedin container
-        "//section[contains(@class,'description')]"             # fallback
-    ]
+        pass
+    # description: all common containers in one query
     texts = []
-    for sel in desc_selectors:
-        try:
-            nodes = driver.find_elements(By.XPATH, sel)
-            for n in nodes:
-                t = n.text.strip()
-                if len(t) > 50:
-                    texts.append(t)
-            if texts:
-                break
-        except Exception:
-            continue
+    try:
+        texts = filter_desc_texts(driver.execute_script(XPATH_TEXTS_JS, DESC_XPATH) or [])
+    except Exception:
+        pass
     # Additional fallback: collect many divs and join
     if not texts:
         try:
-            big = driver.find_element(By.XPATH, "//div[@id='job-details']")
+            big = driver.find_element(By.XPATH, DESC_FALLBACK_XPATH)
             if big:
                 texts.append(big.text)
         except Exception:
@@ -220,21 +350,199 @@ def fetch_job_description(driver, job_url, timeout=6):
     desc = normalize(desc)
     return {"url": job_url, "title": title, "company": company, "description": desc}
 
+# ---------------- parallel description fetch ----------------
+# Selenium drivers are not thread safe, so each worker is a separate process
+# owning its own headless Chrome, created once and reused for every URL.
+_worker_driver = None
+
+# caches and lock files are never needed by a copied profile
+_PROFILE_SKIP = shutil.ignore_patterns("*Cache", "Service Worker", "Crashpad", "Singleton*", "*.lock", "lockfile")
+
+def copy_profile(profile_dir, profile_name="Default"):
+    """Chrome locks its user-data-dir, so extra browsers get a private copy (caller removes it).
+    Only `Local State` and the `profile_name` subdir are copied, without caches."""
+    profile_dir = os.path.expanduser(profile_dir)
+    work_dir = tempfile.mkdtemp(prefix="lh-profile-")
+    try:
+        local_state = os.path.join(profile_dir, "Local State")
+        if os.path.exists(local_state):
+            shutil.copy2(local_state, work_dir)
+        shutil.copytree(os.path.join(profile_dir, profile_name), os.path.join(work_dir, profile_name),
+                        ignore=_PROFILE_SKIP)
+    except Exception:
+        shutil.rmtree(work_dir, ignore_errors=True)
+        raise
+    return work_dir
+
+def _init_fetch_worker(profile_dir=None, profile_name="Default"):
+    global _worker_driver
+    if profile_dir:
+        # profile_dir is the parent's (unlocked) copy; each browser still needs its own
+        profile_dir = copy_profile(profile_dir, profile_name)
+        mp_util.Finalize(None, shutil.rmtree, args=(profile_dir, True), exitpriority=5)
+    _worker_driver = create_driver(profile_dir=profile_dir, profile_name=profile_name, headless=True, lightweight=True)
+    # worker processes skip atexit, so register the quit with multiprocessing
+    mp_util.Finalize(None, _worker_driver.quit, exitpriority=10)
+
+def worker_fetch(job_url):
+    """Fetch one job description in a pool worker; never raises"""
+    # jittered start so workers don't hit LinkedIn in lockstep
+    time.sleep(0.7 + random.random()*0.8)
+    try:
+        return fetch_job_description(_worker_driver, job_url)
+    except Exception as e:
+        print("Fetch failed for", job_url, e)
+        return None
+
+def print_fetched(jd):
+    print("Fetched:", jd["title"][:60], "—", jd["company"][:40], "score candidates", len(jd["description"]))
+
+def fetch_job_descriptions_serial(driver, urls):
+    """Fetch descriptions for urls one by one in driver's tab"""
+    jobs = []
+    for u in urls:
+        try:
+            jd = fetch_job_description(driver, u)
+            jobs.append(jd)
+            print_fetched(jd)
+        except Exception as e:
+            print("Fetch failed for", u, e)
+        time.sleep(0.7 + random.random()*0.8)
+    return jobs
+
+def fetch_job_descriptions_parallel(urls, workers=4, profile_dir=None, profile_name="Default"):
+    """Fetch descriptions for urls with `workers` headless Chrome processes (keeps input order).
+    Raises OSError if the profile can't be copied, BrokenProcessPool if a worker fails to start."""
+    # copy the open profile once here; workers copy this small, unlocked snapshot
+    snapshot = copy_profile(profile_dir, profile_name) if profile_dir else None
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_fetch_worker,
+                                 initargs=(snapshot, profile_name)) as ex:
+            return [jd for jd in ex.map(worker_fetch, urls) if jd]
+    finally:
+        if snapshot:
+            shutil.rmtree(snapshot, ignore_errors=True)
+
+# ---------------- playwright description fetch ----------------
+# Same XPath heuristics as fetch_job_description, but many pages are driven
+# concurrently from one event loop over CDP instead of one WebDriver tab.
+async def _pw_first_text(page, xpath):
+    loc = page.locator(f"xpath={xpath}")
+    if await loc.count() == 0:
+        return ""
+    return (await loc.first.inner_text()).strip()
+
+async def fetch_job_description_async(page, job_url, timeout=6):
+    """Playwright counterpart of fetch_job_description"""
+    await page.goto(job_url, timeout=timeout*1000*3, wait_until="domcontentloaded")
+    try:
+        await page.wait_for_function(DESC_READY_FN, arg=f"{DESC_XPATH} | {DESC_FALLBACK_XPATH}",
+                                     polling=100, timeout=timeout*1000)
+    except Exception:
+        pass
+    title = await _pw_first_text(page, TITLE_XPATH)
+    company = await page.evaluate(FIRST_TEXT_FN, list(COMPANY_SELECTORS)) or ""
+    texts = filter_desc_texts(await page.locator(f"xpath={DESC_XPATH}").all_inner_texts())
+    if not texts:
+        texts = [await _pw_first_text(page, DESC_FALLBACK_XPATH)]
+    desc = "\n".join(texts).strip()
+    return {"url": job_url, "title": normalize(title), "company": normalize(company), "description": normalize(desc)}
+
+async def _fetch_all_async(urls, profile_dir=None, profile_name="Default", headless=True, concurrency=8):
+    sem = asyncio.Semaphore(concurrency)
+    async with async_playwright() as pw:
+        if profile_dir:
+            # logged-in copy of the Chrome profile; the selenium driver holds the original
+            ctx = await pw.chromium.launch_persistent_context(profile_dir, headless=headless,
+                                                              args=[f"--profile-directory={profile_name}"])
+            browser = None
+        else:
+            browser = await pw.chromium.launch(headless=headless)
+            ctx = await browser.new_context()
+
+        async def one(u):
+            async with sem:
+                # polite jitter per page so concurrent loads don't hit LinkedIn in lockstep
+                await asyncio.sleep(0.7 + random.random()*0.8)
+                page = await ctx.new_page()
+                try:
+                    return await fetch_job_description_async(page, u)
+                except Exception as e:
+                    print("Fetch failed for", u, e)
+                    return None
+                finally:
+                    await page.close()
+
+        try:
+            results = await asyncio.gather(*(one(u) for u in urls))
+        finally:
+            await ctx.close()
+            if browser:
+                await browser.close()
+    return [jd for jd in results if jd]
+
+def fetch_job_descriptions_playwright(urls, profile_dir=None, profile_name="Default", headless=True, concurrency=8):
+    """Fetch descriptions for urls concurrently with Playwright (keeps input order)"""
+    if async_playwright is None:
+        raise RuntimeError("playwright not installed. Install with `pip install playwright && playwright install chromium`.")
+    work_dir = copy_profile(profile_dir, profile_name) if profile_dir else None
+    try:
+        return asyncio.run(_fetch_all_async(urls, profile_dir=work_dir, profile_name=profile_name,
+                                            headless=headless, concurrency=concurrency))
+    finally:
+        if work_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
 # ---------------- ranking ----------------
-def rank_jobs_by_similarity(resume_text, jobs, top_k=10):
-    docs = [resume_text] + [j["description"] or j["title"] + " " + j["company"] for j in jobs]
+def job_doc(j):
     # fallback: replace empty descriptions with their title/company to avoid all-empty docs
+    return j["description"] or j["title"] + " " + j["company"]
+
+DEFAULT_TFIDF_CACHE = os.path.join("~", ".cache", "linkedin-helper", "tfidf.pkl")
+
+# stateless term hashing: one pass over the docs, no vocabulary to build
+HASHER = HashingVectorizer(stop_words="english", n_features=2**17, alternate_sign=False, norm=None)
+
+def vectorize(docs, cache_path=None, refit=False):
+    """TF-IDF matrix for docs (L2-normalized rows); with cache_path, previously
+    fitted idf weights are loaded and only applied (.transform), otherwise they
+    are fitted and saved there. Hashed columns don't depend on the docs, so a
+    cached idf always lines up with new docs"""
+    counts = HASHER.transform(docs)
+    if cache_path:
+        cache_path = os.path.expanduser(cache_path)
+        if not refit and os.path.exists(cache_path):
+            try:
+                tfidf = joblib.load(cache_path)
+                if isinstance(tfidf, TfidfTransformer):
+                    return tfidf.transform(counts)
+            except Exception as e:
+                print("Ignoring unreadable TF-IDF cache:", e)
+    tfidf = TfidfTransformer(norm="l2")
+    X = tfidf.fit_transform(counts)
+    if cache_path:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        joblib.dump(tfidf, cache_path)
+    return X
+
+def rank_jobs_by_similarity(resume_text, jobs, top_k=10, pool=(), cache_path=None, refit=False):
+    """Rank jobs against the resume; `pool` jobs only contribute to the fitted
+    idf (e.g. the prefilter losers) and are never returned. With a cache_path
+    that already exists (and no refit), the cached idf is used instead and
+    `pool` has no effect"""
+    docs = [resume_text] + [job_doc(j) for j in jobs] + [job_doc(j) for j in pool]
     for i in range(len(docs)):
         if not docs[i].strip(): docs[i] = " "
-    vec = TfidfVectorizer(stop_words="english", max_features=5000)
-    X = vec.fit_transform(docs)
-    # cosine similarity between resume (row 0) and each job row
-    resume_vec = X[0]
-    job_vecs = X[1:]
-    sims = (job_vecs * resume_vec.T).toarray().reshape(-1)
-    ranked_idx = np.argsort(-sims)
+    X = vectorize(docs, cache_path=cache_path, refit=refit)
+    # rows are L2-normalized, so the plain dot product is the cosine similarity
+    # between resume (row 0) and each job row
+    sims = linear_kernel(X[0:1], X[1:len(jobs)+1]).ravel()
+    # partial selection of the top_k, then sort only those
+    top_k = min(top_k, len(sims))
+    ranked_idx = np.argpartition(-sims, top_k - 1)[:top_k] if top_k > 0 else np.array([], dtype=int)
+    ranked_idx = ranked_idx[np.argsort(-sims[ranked_idx])]
     ranked = []
-    for idx in ranked_idx[:top_k]:
+    for idx in ranked_idx:
         j = jobs[idx]
         j_copy = j.copy()
         j_copy["score"] = float(sims[idx])
@@ -249,16 +557,28 @@ def safe_send_keys(el, text):
         pass
     el.send_keys(text)
 
+def dialog_text(driver):
+    try:
+        return driver.find_element(By.XPATH, DIALOG_XPATH).text
+    except Exception:
+        return None
+
+def step_advanced(btn, before):
+    """Wait condition: the clicked step button went stale or the dialog content changed"""
+    def _cond(driver):
+        return EC.staleness_of(btn)(driver) or dialog_text(driver) != before
+    return _cond
+
 def click_easy_apply_and_fill(driver, job_url, resume_path=None, cover_text=None, phone=None, auto_submit=False):
     # This re-uses the earlier approach: open URL, click Easy Apply, upload resume, fill textarea, traverse Next buttons, pause before final Submit
-    driver.get(job_url); time.sleep(1.2 + random.random()*0.8)
+    driver.get(job_url)
+    wait = wait_for(driver)
     # scroll a bit
     driver.execute_script("window.scrollTo(0, 500);")
-    time.sleep(0.8)
     # find Easy Apply button (several heuristics)
     easy_btn = None
     try:
-        easy_btn = WebDriverWait(driver, 4).until(
+        easy_btn = wait_for(driver, 4).until(
             EC.element_to_be_clickable((By.XPATH, "//button[.//span[contains(text(),'Easy Apply')]]"))
         )
     except Exception:
@@ -275,13 +595,11 @@ def click_easy_apply_and_fill(driver, job_url, resume_path=None, cover_text=None
         print(" Clicked Easy Apply")
     except Exception as e:
         print(" Click failed:", e); return False
-    time.sleep(1.2)
     # wait for modal / dialog
     try:
-        WebDriverWait(driver, 6).until(EC.presence_of_element_located((By.XPATH, "//div[contains(@role,'dialog')]")))
+        wait_for(driver, 6).until(EC.visibility_of_element_located((By.XPATH, DIALOG_XPATH)))
     except Exception:
         pass
-    time.sleep(0.8)
     # Upload resume if file input exists
     if resume_path:
         try:
@@ -343,40 +661,64 @@ def click_easy_apply_and_fill(driver, job_url, resume_path=None, cover_text=None
     # Click Next/Continue until final
     max_steps = 8
     for _ in range(max_steps):
-        time.sleep(0.9 + random.random()*0.6)
-        # try to find a final submit/review button first
         try:
-            submit_btn = driver.find_element(By.XPATH, "//button[.//span[contains(text(),'Submit') or contains(text(),'Apply') or contains(text(),'Done')]]")
-            txt = (submit_btn.text or "").lower()
-            if any(k in txt for k in ["submit", "apply", "done"]):
-                print(" Reached final step (button text):", txt)
-                if auto_submit:
-                    try:
-                        submit_btn.click()
-                        print(" Auto-submitted")
-                        time.sleep(1)
-                        return True
-                    except Exception as e:
-                        print(" Auto-submit failed:", e)
-                        return False
-                else:
-                    print(" Pausing for manual review. Please submit manually in the browser.")
-                    # pause to allow manual submission
-                    time.sleep(10 + random.random()*6)
-                    return True
+            wait.until(EC.visibility_of_element_located((By.XPATH, DIALOG_XPATH + "//button")))
         except Exception:
             pass
+        # one query for every step button, classified by text in Python
+        submit_btn = None
+        submit_txt = ""
+        next_btns = []
+        try:
+            btns = driver.find_elements(By.XPATH, NAV_XPATH)
+        except Exception:
+            btns = []
+        for btn in btns:
+            try:
+                txt = (btn.text or "").lower()
+            except Exception:
+                # went stale while the step re-rendered; the rest may still be valid
+                continue
+            if any(k in txt for k in SUBMIT_WORDS):
+                submit_btn, submit_txt = btn, txt
+                break
+            if any(k in txt for k in NEXT_WORDS):
+                next_btns.append(btn)
+        if submit_btn is not None:
+            print(" Reached final step (button text):", submit_txt)
+            if auto_submit:
+                try:
+                    submit_btn.click()
+                    print(" Auto-submitted")
+                    time.sleep(1)
+                    return True
+                except Exception as e:
+                    print(" Auto-submit failed:", e)
+                    return False
+            else:
+                print(" Pausing for manual review. Please submit manually in the browser.")
+                # pause to allow manual submission
+                time.sleep(10 + random.random()*6)
+                return True
         # else click Next or Continue if present
         clicked = False
-        for xp in ["//button[.//span[contains(text(),'Next')]]", "//button[.//span[contains(text(),'Continue')]]"]:
+        for btn in next_btns:
             try:
-                btn = driver.find_element(By.XPATH, xp)
                 if btn.is_displayed() and btn.is_enabled():
-                    btn.click(); clicked = True; time.sleep(1.0 + random.random()*0.8); break
+                    before = dialog_text(driver)
+                    btn.click(); clicked = True
+                    break
             except Exception:
                 continue
         if not clicked:
             break
+        # don't read buttons again until the next step has replaced this one
+        try:
+            wait.until(step_advanced(btn, before))
+        except Exception:
+            pass
+        # small jitter for rate-limit avoidance only
+        time.sleep(0.3 + random.random()*0.4)
     print(" Did not find final submit; exiting modal and continuing.")
     # try to close modal
     try:
@@ -392,12 +734,15 @@ def pipeline(args):
     resume_text = normalize(resume_text)
     driver = create_driver(profile_dir=args.profile, profile_name=args.profile_dir, headless=args.headless)
     try:
-        all_job_urls = []
+        all_jobs = []
         keywords = [k.strip() for k in args.keywords.split(",") if k.strip()]
         for kw in keywords:
             url = build_search_url(kw, location=args.location)
             driver.get(url)
-            time.sleep(2 + random.random())
+            try:
+                wait_for(driver).until(EC.presence_of_element_located((By.XPATH, SEARCH_RESULTS_XPATH)))
+            except Exception:
+                pass
             # try to click filters (Optional: filter for Easy Apply - not always present)
             try:
                 # click 'All Filters' -> Easy Apply? (UI changes; skip reliably)
@@ -406,27 +751,61 @@ def pipeline(args):
                 pass
             collected = scroll_container_collect_links(driver, max_links=args.collect)
             print(f"Collected {len(collected)} from keyword '{kw}'")
-            all_job_urls.extend(collected)
+            all_jobs.extend(collected)
             # polite pause
             time.sleep(1 + random.random()*1.5)
         # dedupe preserve order
-        seen = set(); uniq_urls = []
-        for u in all_job_urls:
-            if u not in seen:
-                seen.add(u); uniq_urls.append(u)
-        print("Total unique jobs collected:", len(uniq_urls))
+        # first stub per URL wins (a later keyword may only have an anchor-only stub)
+        by_url = {}
+        for j in all_jobs:
+            by_url.setdefault(j["url"], j)
+        uniq_jobs = list(by_url.values())
+        print("Total unique jobs collected:", len(uniq_jobs))
+        if any(j["title"] or j["company"] for j in uniq_jobs):
+            # cheap prefilter on search-card title/company; only survivors get a page load
+            n_fetch = args.fetch or 3 * args.top
+            survivors = rank_jobs_by_similarity(resume_text, uniq_jobs, top_k=n_fetch)
+            print(f"Fetching descriptions for top {len(survivors)} by title/company")
+        else:
+            # anchor-only stubs (no card text): every score would be 0, keep collection order
+            survivors = uniq_jobs[: min(len(uniq_jobs), args.collect)]
+            print(f"No card titles found; fetching descriptions for the first {len(survivors)}")
         # fetch job descriptions (limit)
         jobs = []
-        for u in uniq_urls[: min(len(uniq_urls), args.collect)]:
+        fetch_urls = [j["url"] for j in survivors]
+        if args.backend == "playwright":
             try:
-                jd = fetch_job_description(driver, u)
-                jobs.append(jd)
-                print("Fetched:", jd["title"][:60], "—", jd["company"][:40], "score candidates", len(jd["description"]))
-            except Exception as e:
-                print("Fetch failed for", u, e)
-            time.sleep(0.7 + random.random()*0.8)
-        # rank
-        ranked = rank_jobs_by_similarity(resume_text, jobs, top_k=args.top)
+                jobs = fetch_job_descriptions_playwright(fetch_urls, profile_dir=args.profile, profile_name=args.profile_dir,
+                                                         headless=True, concurrency=args.concurrency)
+                for jd in jobs:
+                    print_fetched(jd)
+            except (OSError, RuntimeError) as e:
+                print("Playwright fetch failed, fetching serially:", e)
+                jobs = fetch_job_descriptions_serial(driver, fetch_urls)
+        elif args.workers > 1:
+            try:
+                jobs = fetch_job_descriptions_parallel(fetch_urls, workers=args.workers,
+                                                       profile_dir=args.profile, profile_name=args.profile_dir)
+                for jd in jobs:
+                    print_fetched(jd)
+            except (BrokenProcessPool, OSError) as e:
+                print("Parallel fetch failed, fetching serially:", e)
+                jobs = fetch_job_descriptions_serial(driver, fetch_urls)
+        else:
+            jobs = fetch_job_descriptions_serial(driver, fetch_urls)
+        # re-rank survivors on full descriptions; keep the card stub if a fetch failed
+        fetched = {jd["url"]: jd for jd in jobs}
+        jobs = []
+        for stub in survivors:
+            jd = fetched.get(stub["url"])
+            if jd:
+                jd = dict(jd, title=jd["title"] or stub["title"], company=jd["company"] or stub["company"])
+            jobs.append(jd or stub)
+        # fit on the whole collected pool so idf doesn't hinge on which jobs survived
+        survivor_urls = set(fetch_urls)
+        pool = [j for j in uniq_jobs if j["url"] not in survivor_urls]
+        ranked = rank_jobs_by_similarity(resume_text, jobs, top_k=args.top, pool=pool,
+                                         cache_path=args.tfidf_cache or None, refit=args.refit)
         print("\nTop ranked jobs:")
         for i,j in enumerate(ranked):
             print(i+1, f"score={j['score']:.4f}", j['title'][:60], "-", j['company'][:40], "\n ", j['url'])
@@ -439,9 +818,10 @@ def pipeline(args):
         print("\nSaved selected job URLs to selected_urls.txt")
         # Apply loop
         if args.do_apply:
+            cover_text = Path(args.cover_file).expanduser().read_text(encoding="utf-8", errors="ignore") if args.cover_file else args.cover_text
             for u in to_apply:
                 print("\n=== Processing:", u)
-                ok = click_easy_apply_and_fill(driver, u, resume_path=args.resume, cover_text=(open(args.cover_file).read() if args.cover_file else args.cover_text), phone=args.phone, auto_submit=args.auto_submit)
+                ok = click_easy_apply_and_fill(driver, u, resume_path=args.resume, cover_text=cover_text, phone=args.phone, auto_submit=args.auto_submit)
                 # small random delay between jobs
                 time.sleep(3 + random.random()*3)
     finally:
@@ -457,14 +837,21 @@ def main():
     ap.add_argument("--keywords", required=True, help="comma separated keywords")
     ap.add_argument("--collect", type=int, default=50, help="max job links to collect per keyword")
     ap.add_argument("--top", type=int, default=8, help="how many top matched jobs to attempt")
+    ap.add_argument("--fetch", type=int, default=0, help="how many title-prefiltered jobs to fetch full descriptions for (default 3x --top)")
     ap.add_argument("--profile", default=None, help="chrome user-data-dir (so you're logged in)")
     ap.add_argument("--profile-dir", default="Default", help="chrome profile directory name")
     ap.add_argument("--headless", action="store_true")
+    ap.add_argument("--workers", type=int, default=1, help="parallel headless browsers for fetching descriptions")
+    ap.add_argument("--backend", choices=["selenium", "playwright"], default="selenium", help="browser backend for fetching descriptions")
+    ap.add_argument("--concurrency", type=int, default=8, help="concurrent pages with the playwright backend")
     ap.add_argument("--do-apply", action="store_true", help="actually run the Easy Apply fills (pauses for manual submit)")
     ap.add_argument("--auto-submit", action="store_true", help="AUTO SUBMIT at final step (risky!)")
     ap.add_argument("--cover-file", default="", help="path to cover letter file to paste into application")
     ap.add_argument("--cover-text", default="", help="cover text inline (used if cover-file not provided)")
     ap.add_argument("--phone", default="", help="phone number to fill if present")
+    ap.add_argument("--tfidf-cache", default="", help=f"opt-in file for fitted TF-IDF idf weights, e.g. {DEFAULT_TFIDF_CACHE}; "
+                    "once it exists it replaces per-run idf fitting on the collected jobs (see --refit)")
+    ap.add_argument("--refit", action="store_true", help="refit the TF-IDF idf weights and overwrite the cache")
     args = ap.parse_args()
     pipeline(args)
 